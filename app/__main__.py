@@ -1,4 +1,3 @@
-import asyncio
 from contextlib import suppress
 
 from loguru import logger
@@ -6,6 +5,12 @@ from loguru import logger
 from app.bot import GhosttyBot
 from app.config import config
 
+try:
+    from uvloop import run
+except ImportError:
+    # uvloop does not support Windows; fall back to the default event loop there.
+    from asyncio import run
+
 
 async def main() -> None:
     async with GhosttyBot() as bot:
@@ -14,4 +19,4 @@ async def main() -> None:
 
 
 with suppress(KeyboardInterrupt):
-    asyncio.run(main())
+    run(main())
@@ -1,13 +1,23 @@
+import ast
 import asyncio
 import datetime as dt
-import importlib
 import importlib.util
-import pkgutil
+import os
 import sys
+from collections.abc import Mapping
 from contextvars import ContextVar
 from pathlib import Path
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Literal, cast, final, get_args, override
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Literal,
+    cast,
+    final,
+    get_args,
+    override,
+)
 
 import discord as dc
 import sentry_sdk
@@ -20,9 +30,11 @@ from app.config import Config, config, config_var, gh_var
 from app.status import BotStatus
 from toolbox.discord import pretty_print_account, try_dm
 from toolbox.errors import handle_error, interaction_error_handler
+from toolbox.message_moving import forget_webhooks
 from toolbox.messages import REGULAR_MESSAGE_TYPES
 
 if TYPE_CHECKING:
+    from app.components.message_filter import MessageFilter
     from toolbox.discord import Account
 
 EmojiName = Literal[
@@ -40,14 +52,47 @@ EmojiName = Literal[
     "pull_open",
 ]
 
-_EMOJI_NAMES = frozenset(get_args(EmojiName))
+_EMOJI_NAMES: Final[frozenset[EmojiName]] = frozenset({
+    "commit",
+    "discussion",
+    "discussion_answered",
+    "discussion_duplicate",
+    "discussion_outdated",
+    "issue_closed_completed",
+    "issue_closed_unplanned",
+    "issue_open",
+    "pull_closed",
+    "pull_draft",
+    "pull_merged",
+    "pull_open",
+})
+if __debug__:
+    assert frozenset(get_args(EmojiName)) == _EMOJI_NAMES, "EmojiName out of sync"
+
+_MISSING_PLACEHOLDER: Final = "❓"
 
-emojis_var = ContextVar[MappingProxyType[EmojiName, dc.Emoji | Literal["❓"]]](
-    "emojis", default=MappingProxyType(dict.fromkeys(_EMOJI_NAMES, "❓"))
+# The maximum number of extensions that are loaded concurrently during startup.
+MAX_CONCURRENT_EXTENSION_LOADS = 8
+
+# The default is only used when no bot is running (e.g. in tests); GhosttyBot replaces
+# it with a plain dict that load_emojis fills in.
+emojis_var = ContextVar[Mapping[EmojiName, dc.Emoji | Literal["❓"]]](
+    "emojis",
+    default=MappingProxyType(dict.fromkeys(_EMOJI_NAMES, _MISSING_PLACEHOLDER)),
 )
 emojis = emojis_var.get
 
 
+def _defines_setup(path: str | Path) -> bool:
+    # Look for a top-level setup() in the source instead of importing the module, as
+    # load_extension() imports it anyway and would otherwise execute it twice.
+    return any(
+        isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+        and node.name == "setup"
+        for node in ast.parse(Path(path).read_bytes()).body
+    )
+
+
 @final
 class GhosttyBot(commands.Bot):
     def __init__(self) -> None:
@@ -69,6 +114,8 @@ class GhosttyBot(commands.Bot):
 
         self.tree.on_error = interaction_error_handler
         self.bot_status = BotStatus()
+        # app.components.message_filter.MessageFilter will set this when it's loaded.
+        self.message_filter: MessageFilter | None = None
 
         # Retain the default: this dict will later be mutated by load_emojis, and if
         # a cog accesses emojis before load_emojis finishes it'll throw a KeyError.
@@ -76,8 +123,9 @@ class GhosttyBot(commands.Bot):
         # Contexts, within which ContextVars are stored, are thread-local; setting
         # emojis_var in load_emojis doesn't work as they're set in a different Context,
         # which asyncio never has a chance to copy into other coroutines' Contexts.
-        # Thus, set the variable here and mutate its value in load_emojis.
-        self._emojis_context_token = emojis_var.set(MappingProxyType(self._emojis))
+        # Thus, set the variable here and mutate its value in load_emojis. The dict is
+        # stored as is, so every emojis() lookup is a single dict lookup.
+        self._emojis_context_token = emojis_var.set(self._emojis)
         self.emojis_loaded = asyncio.Event()
 
     @override
@@ -94,8 +142,9 @@ class GhosttyBot(commands.Bot):
     async def load_extension(self, name: str, *, package: str | None = None) -> None:
         short_name = name.removeprefix("app.components.")
         logger.debug("loading extension {name}", name=short_name)
-        with sentry_sdk.start_span(op="bot.load_extension", name=short_name):
-            await super().load_extension(name, package=package)
+        # No Sentry span here: setup_hook's transaction already covers the initial load
+        # as a whole, and a span per extension only adds overhead to startup.
+        await super().load_extension(name, package=package)
 
     async def _try_extension(
         self,
@@ -136,11 +185,19 @@ class GhosttyBot(commands.Bot):
 
     @override
     async def setup_hook(self) -> None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTENSION_LOADS)
+
+        async def load(extension: str) -> None:
+            async with semaphore:
+                # A single broken extension shouldn't take the whole TaskGroup, and
+                # thus every other extension, down with it.
+                await self.try_load_extension(extension)
+
         with sentry_sdk.start_transaction(op="bot.setup", name="Initial load"):
             await self.bot_status.load_git_data()
             async with asyncio.TaskGroup() as group:
                 for extension in self.get_component_extension_names():
-                    group.create_task(self.load_extension(extension))
+                    group.create_task(load(extension))
         logger.info("loaded {ext_count} extensions", ext_count=len(self.extensions))
 
     async def on_ready(self) -> None:
@@ -148,11 +205,8 @@ class GhosttyBot(commands.Bot):
         await self.load_emojis()
         logger.info("logged in as {user}", user=self.user)
 
-    def _fails_message_filters(self, message: dc.Message) -> bool:
-        # This can't be the MessageFilter cog type because that would cause an import
-        # cycle.
-        message_filter: Any = self.get_cog("MessageFilter")
-        return bool(message_filter and message_filter.check(message))
+    async def on_webhooks_update(self, channel: dc.abc.GuildChannel) -> None:
+        forget_webhooks(channel.id)
 
     @override
     async def on_message(self, message: dc.Message, /) -> None:
@@ -167,27 +221,50 @@ class GhosttyBot(commands.Bot):
             await try_dm(message.author, "pong")
             return
 
-        if not self._fails_message_filters(message):
+        message_filter = self.message_filter
+        if message_filter is None or not message_filter.check(message):
             self.dispatch("message_filter_passed", message)
 
     @classmethod
     def get_component_extension_names(cls) -> frozenset[str]:
+        # Not cached: the developer commands rely on this to pick up components that
+        # were added or removed while the bot is running. Unlike pkgutil.walk_packages,
+        # scanning the directories ourselves doesn't import every package just to find
+        # its submodules.
         modules: set[str] = set()
-        for module_info in pkgutil.walk_packages(
-            [Path(__file__).parent / "components"], "app.components."
-        ):
-            if cls.is_valid_extension(module_info.name):
-                modules.add(module_info.name)
+        directories = [(Path(__file__).parent / "components", "app.components.")]
+        while directories:
+            directory, prefix = directories.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("_"):
+                        continue
+                    if entry.is_dir():
+                        init = Path(entry.path, "__init__.py")
+                        if not init.is_file():
+                            continue
+                        name = prefix + entry.name
+                        if _defines_setup(init):
+                            modules.add(name)
+                        directories.append((Path(entry.path), name + "."))
+                    elif entry.name.endswith(".py") and _defines_setup(entry.path):
+                        modules.add(prefix + entry.name.removesuffix(".py"))
 
         return frozenset(modules)
 
     @staticmethod
     def is_valid_extension(extension: str) -> bool:
-        return (
-            extension.startswith("app.components.")
-            and bool(importlib.util.find_spec(extension))
-            and callable(getattr(importlib.import_module(extension), "setup", None))
-        )
+        if not extension.startswith("app.components."):
+            return False
+        try:
+            spec = importlib.util.find_spec(extension)
+        except ModuleNotFoundError:
+            # find_spec() imports parent packages, so names from the developer commands
+            # can fail here if one of them doesn't exist.
+            return False
+        if spec is None or spec.origin is None:
+            return False
+        return _defines_setup(spec.origin)
 
     async def load_emojis(self) -> None:
         self.emojis_loaded.clear()
@@ -196,9 +273,11 @@ class GhosttyBot(commands.Bot):
             if emoji.name in _EMOJI_NAMES:
                 self._emojis[cast("EmojiName", emoji.name)] = emoji
 
-        if missing_emojis := _EMOJI_NAMES - {
-            k for k, v in self._emojis.items() if v != "❓"
-        }:
+        if missing_emojis := [
+            name
+            for name, value in self._emojis.items()
+            if value == _MISSING_PLACEHOLDER
+        ]:
             emoji_list = ", ".join(missing_emojis)
             logger.error("failed to load emojis {emojis}", emojis=emoji_list)
 
@@ -1,3 +1,4 @@
+import asyncio
 import datetime as dt
 from typing import TYPE_CHECKING, final, override
 
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
 
     from app.bot import GhosttyBot
 
+# The maximum number of help posts that are archived concurrently.
+MAX_CONCURRENT_EDITS = 5
+
 
 @final
 class AutoClose(commands.Cog):
@@ -31,6 +35,12 @@ class AutoClose(commands.Cog):
         failures: list[dc.Thread] = []
 
         open_posts = len(config().channels.help.threads)
+        # Compare snowflakes directly instead of converting every post's last message ID
+        # into a datetime.
+        one_day_ago = dc.utils.time_snowflake(
+            dt.datetime.now(tz=dt.UTC) - dt.timedelta(hours=24)
+        )
+        posts_to_close: list[dc.Thread] = []
         with sentry_sdk.start_transaction(op="bot.scan", name="all of help_channel"):
             for post in config().channels.help.threads:
                 with sentry_sdk.start_span(op="bot.scan", name="post"):
@@ -39,14 +49,25 @@ class AutoClose(commands.Cog):
                     if post.last_message_id is None:
                         failures.append(post)
                         continue
-                    one_day_ago = dt.datetime.now(tz=dt.UTC) - dt.timedelta(hours=24)
-                    if dc.utils.snowflake_time(post.last_message_id) < one_day_ago:
-                        try:
-                            await post.edit(archived=True)
-                            closed_posts.append(post)
-                        except dc.HTTPException:
-                            failures.append(post)
-                            continue
+                    if post.last_message_id < one_day_ago:
+                        posts_to_close.append(post)
+
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_EDITS)
+
+            async def close_post(post: dc.Thread) -> None:
+                async with semaphore:
+                    await post.edit(archived=True)
+
+            results = await asyncio.gather(
+                *map(close_post, posts_to_close), return_exceptions=True
+            )
+            for post, result in zip(posts_to_close, results, strict=True):
+                if isinstance(result, dc.HTTPException):
+                    failures.append(post)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    closed_posts.append(post)
 
         self.bot.bot_status.last_scan_results = (
             dt.datetime.now(tz=dt.UTC),
@@ -10,7 +10,7 @@ from loguru import logger
 
 from app.config import config, gh
 from toolbox.discord import generate_autocomplete
-from toolbox.message_moving import get_or_create_webhook
+from toolbox.message_moving import with_webhook
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -70,11 +70,14 @@ class Docs(commands.Cog):
                     self.get_docs_link(section, page)
                 )
                 return
-            webhook = await get_or_create_webhook(interaction.channel)
-            await webhook.send(
-                f"{message}\n{self.get_docs_link(section, page)}",
-                username=interaction.user.display_name,
-                avatar_url=interaction.user.display_avatar.url,
+            content = f"{message}\n{self.get_docs_link(section, page)}"
+            await with_webhook(
+                interaction.channel,
+                lambda webhook: webhook.send(
+                    content,
+                    username=interaction.user.display_name,
+                    avatar_url=interaction.user.display_avatar.url,
+                ),
             )
             await interaction.response.send_message(
                 "Documentation linked.", ephemeral=True
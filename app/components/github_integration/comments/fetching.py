@@ -504,6 +504,9 @@ async def _get_entity_starter(entity_gist: EntityGist, _: int) -> Comment | None
 
 
 async def get_comments(content: str) -> AsyncGenerator[Comment]:
+    if "#" not in content:
+        # Every link COMMENT_PATTERN matches has a fragment, so don't bother running it.
+        return
     found_comments = set[Comment]()
     for match in COMMENT_PATTERN.finditer(content):
         owner, repo, kind, number, event, event_no = map(str, match.groups())
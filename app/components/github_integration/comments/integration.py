@@ -13,6 +13,7 @@ from toolbox.linker import (
     ProcessedMessage,
     remove_view_after_delay,
 )
+from toolbox.misc import atake
 
 if TYPE_CHECKING:
     from app.bot import GhosttyBot
@@ -77,18 +78,17 @@ class GitHubComments(commands.Cog):
 
     @commands.Cog.listener("on_message_filter_passed")
     async def reply_with_comments(self, message: dc.Message) -> None:
-        embeds = [
-            self.comment_to_embed(comment)
-            async for comment in get_comments(message.content)
-        ]
-        if not embeds:
+        # Fetch one comment more than can be sent to know whether any were omitted,
+        # without fetching the rest of them.
+        comments = await atake(get_comments(message.content), 11)
+        if not comments:
             return
-        if len(embeds) > 10:
-            omitted = len(embeds) - 10
-            note = f"{omitted} comment{'s were' if omitted > 1 else ' was'} omitted"
-            embeds = embeds[:10]
+        if len(comments) > 10:
+            note = "some comments were omitted"
+            comments = comments[:10]
         else:
             note = None
+        embeds = [self.comment_to_embed(comment) for comment in comments]
         sent_message = await message.reply(
             content=note,
             embeds=embeds,
@@ -102,7 +102,9 @@ class GitHubComments(commands.Cog):
             group.create_task(remove_view_after_delay(sent_message))
 
     async def process(self, msg: dc.Message) -> ProcessedMessage:
-        comments = [self.comment_to_embed(i) async for i in get_comments(msg.content)]
+        comments = [
+            self.comment_to_embed(i) for i in await atake(get_comments(msg.content), 10)
+        ]
         return ProcessedMessage(embeds=comments, item_count=len(comments))
 
     @commands.Cog.listener()
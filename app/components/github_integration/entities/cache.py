@@ -51,7 +51,7 @@ class EntityCache(TTLCache[tuple[EntitySignature, str | None], Entity]):
         unhinted_key = key[0], None
         if unhinted_key not in self:
             logger.debug("{key} not in cache; fetching", key=key)
-            await self.fetch(key)
+            await self._fetch_coalesced(key)
         try:
             _, value = self[unhinted_key]
         except KeyError:
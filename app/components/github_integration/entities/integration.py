@@ -8,7 +8,7 @@ from discord.ext import commands, tasks
 
 from .cache import entity_cache
 from .fmt import entity_message, extract_entities
-from .resolution import ENTITY_REGEX
+from .resolution import ENTITY_REGEX, may_contain_entities
 from app.components.github_integration.models import Entity
 from toolbox.discord import is_dm, safe_edit, suppress_embeds_after_delay
 from toolbox.linker import ItemActions, MessageLinker, remove_view_after_delay
@@ -77,7 +77,10 @@ class GitHubEntities(commands.Cog):
 
     @commands.Cog.listener("on_message_filter_passed")
     async def reply_with_entities(self, message: dc.Message) -> None:
-        if not ENTITY_REGEX.search(message.content):
+        if not (
+            may_contain_entities(message.content)
+            and ENTITY_REGEX.search(message.content)
+        ):
             return
 
         if is_dm(message.author):
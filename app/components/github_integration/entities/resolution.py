@@ -1,6 +1,8 @@
+import asyncio
 import re
 from contextlib import suppress
 from functools import reduce
+from itertools import islice
 from typing import TYPE_CHECKING, final, override
 
 from githubkit.exception import RequestFailed
@@ -24,6 +26,16 @@ ENTITY_REGEX = re.compile(
     r"(?P<number>\d{1,6})(?!\.\d|/?#)\b",
     re.IGNORECASE,
 )
+_GITHUB_LINK_REGEX = re.compile(r"github\.com/", re.IGNORECASE)
+# The maximum number of entities resolved from a single message.
+MAX_ENTITY_SIGNATURES = 10
+
+
+def may_contain_entities(content: str) -> bool:
+    # Every mention ENTITY_REGEX accepts is either a # mention or a GitHub link, and
+    # these checks are far cheaper than running the regex on the (vast majority of)
+    # messages that contain neither. The link regex avoids lowercasing the message.
+    return "#" in content or _GITHUB_LINK_REGEX.search(content) is not None
 
 
 @final
@@ -57,40 +69,42 @@ async def find_repo_owner(name: str) -> str:
 async def resolve_repo_signature(
     owner: str | None, repo: str | None
 ) -> tuple[str, str] | None:
-    match owner, repo:
-        case None, None:
+    # This runs for every mention, so the most common case (a plain #1234 mention of the
+    # Ghostty repo) is checked first.
+    if owner is None:
+        if repo is None:
             # The Ghostty repo
             return "ghostty-org", "ghostty"
-        case None, repo if repo in REPO_ALIASES:
+        if alias := REPO_ALIASES.get(repo):
             # Special ghostty-org prefixes
-            return "ghostty-org", REPO_ALIASES[repo]
-        case None, repo:
-            # Only a name provided
-            if repo_owner := await owner_cache.get(repo):
-                return repo_owner, repo
-            return None
-        case owner, None:
-            # Invalid case
-            return None
-        case owner, repo:
-            return owner.rstrip("/"), repo
+            return "ghostty-org", alias
+        # Only a name provided
+        if repo_owner := await owner_cache.get(repo):
+            return repo_owner, repo
+        return None
+    if repo is None:
+        # Invalid case
+        return None
+    return owner.rstrip("/"), repo
 
 
 async def resolve_entity_signatures(
     message: dc.Message,
 ) -> AsyncGenerator[tuple[EntitySignature, str | None]]:
-    valid_signatures = 0
+    mentions: list[tuple[str | None, str | None, int, str | None]] = []
+    has_links = False
     for match in ENTITY_REGEX.finditer(remove_codeblocks(message.content)):
-        site, sep = match["site"], match["sep"]
+        site, owner, repo, sep, raw_number = match.group(
+            "site", "owner", "repo", "sep", "number"
+        )
         # Ensure that the correct separator is used.
         if bool(site) == (sep == "#"):
             continue
         # NOTE: this *must* be after the previous check, as the number can be an empty
         # string if an incorrect separator was used, which would result in a ValueError
         # in the call to int().
-        owner, repo, number = match["owner"], match["repo"], int(match["number"])
-        if site:
-            await message.edit(suppress=True)
+        number = int(raw_number)
+        has_links = has_links or bool(site)
 
         if owner is None:
             if repo is None and number < 10:
@@ -100,9 +114,25 @@ async def resolve_entity_signatures(
                 # Ignore the xkcd prefix, as it is handled by xkcd_mentions.py
                 continue
 
-        if sig := await resolve_repo_signature(owner, repo):
-            kind_hint = sep.strip("/#") if site else None
-            yield (*sig, number), kind_hint
-            valid_signatures += 1
-            if valid_signatures == 10:
-                break
+        mentions.append((owner, repo, number, sep.strip("/#") if site else None))
+
+    if has_links:
+        # Only suppress once, no matter how many links the message contains.
+        await message.edit(suppress=True)
+
+    # Owner lookups are resolved concurrently, but only in batches as large as the
+    # number of signatures still needed. This keeps the number of simultaneous GitHub
+    # searches bounded and stops looking mentions up once ten valid ones were found;
+    # mentions of the same repo share a single lookup thanks to OwnerCache.
+    valid_signatures = 0
+    pending = iter(mentions)
+    while valid_signatures < MAX_ENTITY_SIGNATURES and (
+        batch := list(islice(pending, MAX_ENTITY_SIGNATURES - valid_signatures))
+    ):
+        sigs = await asyncio.gather(
+            *(resolve_repo_signature(owner, repo) for owner, repo, _, _ in batch)
+        )
+        for sig, (_, _, number, kind_hint) in zip(sigs, batch, strict=True):
+            if sig:
+                yield (*sig, number), kind_hint
+                valid_signatures += 1
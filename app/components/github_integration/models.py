@@ -1,6 +1,16 @@
 # pyright: reportUnannotatedClassAttribute=false
 import datetime as dt
-from typing import TYPE_CHECKING, Annotated, Literal, NamedTuple, Self, cast, override
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Literal,
+    NamedTuple,
+    Self,
+    cast,
+    override,
+)
 
 from pydantic import (
     AliasChoices,
@@ -71,9 +81,17 @@ class Reactions(BaseModel):
     rocket: int
 
 
+def _split_pascal_case(name: str) -> str:
+    return name[0] + "".join(f" {c}" if c.isupper() else c for c in name[1:])
+
+
 class Entity(BaseModel):
     model_config = ConfigDict(frozen=True)
 
+    # This is constant for each subclass, so it's computed once in __init_subclass__
+    # instead of every time an entity is formatted.
+    kind: ClassVar[str] = "Entity"
+
     number: int
     title: str
     body: str | None
@@ -82,6 +100,11 @@ class Entity(BaseModel):
     user: GitHubUser
     created_at: dt.datetime
 
+    @override
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.kind = _split_pascal_case(cls.__name__)
+
     def _owner_and_repo(self) -> tuple[str, str]:
         owner, repo, _ = self.html_url.removeprefix("https://github.com/").split("/", 2)
         return owner, repo
@@ -94,12 +117,6 @@ class Entity(BaseModel):
     def repo_name(self) -> str:
         return self._owner_and_repo()[1]
 
-    @property
-    def kind(self) -> str:
-        if not (name := type(self).__name__):
-            return name
-        return name[0] + "".join(f" {c}" if c.isupper() else c for c in name[1:])
-
     def __bool__(self) -> Literal[True]:
         return True
 
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, NamedTuple, cast, final
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple, final, override
 
 import discord as dc
 from discord.ext import commands
@@ -24,45 +25,56 @@ _COPY_TEXT_HINT = (
 )
 
 
+def _has_link(message: dc.Message) -> bool:
+    content = message.content
+    # Every URL_REGEX match starts with "http", and a plain substring check rules out
+    # most link-less messages faster than the regex engine can.
+    return "http" in content and URL_REGEX.search(content) is not None
+
+
 class MessageFilterTuple(NamedTuple):
-    channel_id: int
     filter: Callable[[dc.Message], object]
     template_fillers: tuple[str, str]
 
 
 @final
 class MessageFilter(commands.Cog):
-    message_filters: tuple[MessageFilterTuple, ...]
+    message_filters: dict[int, MessageFilterTuple]
 
     def __init__(self, bot: GhosttyBot) -> None:
         self.bot = bot
 
-        self.message_filters = (
+        # Keyed by channel ID, as every message goes through check() and most of them
+        # are in channels without a filter.
+        self.message_filters = {
             # Delete non-image messages in #showcase
-            MessageFilterTuple(
-                config().channel_ids.showcase,
-                lambda msg: cast("dc.Message", msg).attachments,
+            config().channel_ids.showcase: MessageFilterTuple(
+                attrgetter("attachments"),
                 ("any attachments", "a screenshot or a video"),
             ),
             # Delete non-link messages in #media
-            MessageFilterTuple(
-                config().channel_ids.media,
-                lambda msg: URL_REGEX.search(cast("dc.Message", msg).content),
-                ("a link", "a link"),
+            config().channel_ids.media: MessageFilterTuple(
+                _has_link, ("a link", "a link")
             ),
-        )
+        }
+
+    @override
+    async def cog_load(self) -> None:
+        self.bot.message_filter = self
+
+    @override
+    async def cog_unload(self) -> None:
+        self.bot.message_filter = None
 
     def check(self, message: dc.Message) -> MessageFilterTuple | None:
         """
-        Returns the first message filter that did not pass, or None if all filters
-        passed.
+        Returns the message filter of the message's channel if it did not pass, or None
+        if it passed or the channel has no filter.
         """
-        for msg_filter in self.message_filters:
-            if message.channel.id == msg_filter.channel_id and not msg_filter.filter(
-                message
-            ):
-                return msg_filter
-        return None
+        msg_filter = self.message_filters.get(message.channel.id)
+        if msg_filter is None or msg_filter.filter(message):
+            return None
+        return msg_filter
 
     @commands.Cog.listener()
     async def on_message(self, message: dc.Message) -> None:
@@ -79,12 +91,12 @@ class MessageFilter(commands.Cog):
         notification = _MESSAGE_DELETION_TEMPLATE.format(
             message.channel.mention, *msg_filter.template_fillers
         )
-        if message.content:
+        if content := message.content:
             notification += _MESSAGE_CONTENT_NOTICE
         await try_dm(message.author, notification)
 
-        if message.content:
-            content, file = format_or_file(message.content)
+        if content:
+            content, file = format_or_file(content)
             await try_dm(message.author, content, file=file, silent=True)
             await try_dm(message.author, _COPY_TEXT_HINT, silent=True)
 
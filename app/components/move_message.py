@@ -8,7 +8,7 @@ import discord as dc
 from discord.ext import commands
 
 from app.config import config
-from toolbox.discord import GuildTextChannel, dynamic_timestamp, is_dm, safe_edit
+from toolbox.discord import dynamic_timestamp, is_dm, safe_edit
 from toolbox.errors import SafeModal, SafeView
 from toolbox.message_moving import (
     MOVED_MESSAGE_MODIFICATION_CUTOFF,
@@ -16,21 +16,24 @@ from toolbox.message_moving import (
     MovedMessageLookupFailed,
     SplitSubtext,
     convert_nitro_emojis,
-    get_or_create_webhook,
     message_can_be_moved,
     move_message,
+    with_webhook,
 )
 from toolbox.messages import MAX_ATTACHMENT_SIZE, MessageData, is_attachment_only
 from toolbox.misc import truncate
 
 if TYPE_CHECKING:
     from app.bot import GhosttyBot
-    from toolbox.discord import Account
+    from toolbox.discord import Account, GuildTextChannel
 
 
 # From https://discord.com/developers/docs/topics/opcodes-and-status-codes#json-json-error-codes.
 _MAXIMUM_NUMBER_OF_ACTIVE_THREADS_REACHED = 160006
 
+# Comparing IDs is equivalent to (and cheaper than) comparing creation datetimes.
+_MODIFICATION_CUTOFF_ID = dc.utils.time_snowflake(MOVED_MESSAGE_MODIFICATION_CUTOFF)
+
 _EDIT_METHOD_PROMPT = "What would you like to do?"
 _MESSAGE_EDIT_HELP = (
     "*Edit via modal* displays a text box that allows you to edit the contents of your "
@@ -155,8 +158,20 @@ class SelectChannel(SafeView):
     async def select_channel(
         self, interaction: dc.Interaction, sel: dc.ui.ChannelSelect[Self]
     ) -> None:
-        channel = await self.bot.fetch_channel(sel.values[0].id)
-        assert isinstance(channel, GuildTextChannel)
+        selected = sel.values[0]
+        # The channel is almost always in the cache, which saves a request; threads
+        # that aren't (e.g. archived ones) still have to be fetched.
+        channel = selected.resolve() or await selected.fetch()
+        # One pass over the channel's type both validates it and works out where the
+        # webhook has to be created.
+        match channel:
+            case dc.Thread(parent=dc.TextChannel() | dc.ForumChannel() as parent):
+                webhook_channel, thread = parent, channel
+            case dc.TextChannel():
+                webhook_channel, thread = channel, dc.utils.MISSING
+            case _:
+                msg = f"unexpected channel type: {type(channel).__name__}"
+                raise AssertionError(msg)
         if channel.id == self.message.channel.id:
             await interaction.response.edit_message(
                 content=(
@@ -167,16 +182,11 @@ class SelectChannel(SafeView):
             return
 
         await interaction.response.defer()
-        webhook_channel, thread = (
-            (channel.parent, channel)
-            if isinstance(channel, dc.Thread)
-            else (channel, dc.utils.MISSING)
-        )
-        assert isinstance(webhook_channel, dc.TextChannel | dc.ForumChannel)
-
-        webhook = await get_or_create_webhook(webhook_channel)
-        moved_message = await move_message(
-            self.bot, webhook, self.message, self.executor, thread=thread
+        moved_message = await with_webhook(
+            webhook_channel,
+            lambda webhook: move_message(
+                self.bot, webhook, self.message, self.executor, thread=thread
+            ),
         )
         await interaction.edit_original_response(
             content=f"Moved the message to {channel.mention}.",
@@ -198,7 +208,8 @@ class Ghostping(SafeView):
         # the future if that behavior is changed, as there is no indication that this
         # function needs to be updated were that done.
         super().__init__()
-        self._author_id = author.id if isinstance(author, dc.Member) else author
+        author_id = author.id if isinstance(author, dc.Member) else author
+        self._mention = f"<@{author_id}>"
         self._channel = channel
 
     @dc.ui.button(label="Ghostping", emoji="👻")
@@ -206,16 +217,15 @@ class Ghostping(SafeView):
         self, interaction: dc.Interaction, button: dc.ui.Button[Self]
     ) -> None:
         button.disabled = True
-        mention = f"<@{self._author_id}>"
         await interaction.response.edit_message(
             content=(
                 f"Moved the message to {self._channel.mention} "
-                f"and ghostpinged {mention}."
+                f"and ghostpinged {self._mention}."
             ),
             view=self,
             allowed_mentions=dc.AllowedMentions.none(),
         )
-        await (await self._channel.send(mention)).delete()
+        await (await self._channel.send(self._mention)).delete()
 
 
 @final
@@ -233,13 +243,15 @@ class HelpPostTitle(SafeModal, title="Turn into #help post"):
     async def on_submit(self, interaction: dc.Interaction) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        webhook = await get_or_create_webhook(config().channels.help)
-        msg = await move_message(
-            self.bot,
-            webhook,
-            self._message,
-            cast("dc.Member", interaction.user),
-            thread_name=self.title_.value,
+        msg = await with_webhook(
+            config().channels.help,
+            lambda webhook: move_message(
+                self.bot,
+                webhook,
+                self._message,
+                cast("dc.Member", interaction.user),
+                thread_name=self.title_.value,
+            ),
         )
         await (await msg.channel.send(f"<@{msg.original_author_id}>")).delete()
 
@@ -452,18 +464,21 @@ class DeleteAttachments(SafeView):
         self._message = message
         self._content = preprocessed_content
         self.select = dc.ui.Select(
-            placeholder="Select attachments", max_values=len(message.attachments)
+            placeholder="Select attachments",
+            max_values=len(message.attachments),
+            options=[
+                dc.SelectOption(
+                    label=truncate(attachment.title or attachment.filename, 100),
+                    value=str(attachment.id),
+                )
+                for attachment in message.attachments
+            ],
         )
-        for attachment in message.attachments:
-            self.select.add_option(
-                label=truncate(attachment.title or attachment.filename, 100),
-                value=str(attachment.id),
-            )
         self.select.callback = self.remove_attachments
         self.add_item(self.select)
 
     async def remove_attachments(self, interaction: dc.Interaction) -> None:
-        to_remove = set(map(int, self.select.values))
+        to_remove = frozenset(map(int, self.select.values))
         remaining = [a for a in self._message.attachments if a.id not in to_remove]
         if not remaining and is_attachment_only(
             self._message, preprocessed_content=self._content
@@ -802,7 +817,7 @@ class MoveMessage(commands.Cog):
     ) -> None:
         assert not is_dm(interaction.user)
 
-        if message.created_at < MOVED_MESSAGE_MODIFICATION_CUTOFF or (
+        if message.id < _MODIFICATION_CUTOFF_ID or (
             (moved_message := await MovedMessage.from_message(message))
             is MovedMessageLookupFailed.NOT_FOUND
         ):
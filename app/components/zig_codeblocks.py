@@ -1,8 +1,7 @@
-import re
-import string
-from functools import partial
+import asyncio
+from functools import lru_cache, partial
 from io import BytesIO
-from random import choices
+from itertools import count
 from typing import TYPE_CHECKING, Self, final
 
 import discord as dc
@@ -21,7 +20,7 @@ from toolbox.linker import (
     ProcessedMessage,
     remove_view_after_delay,
 )
-from toolbox.message_moving import get_or_create_webhook, move_message
+from toolbox.message_moving import move_message, with_webhook
 
 if TYPE_CHECKING:
     from collections.abc import Collection
@@ -30,14 +29,18 @@ if TYPE_CHECKING:
 
 MAX_CONTENT = 51_200  # 50 KiB
 MAX_ZIG_FILE_SIZE = 8_388_608  # 8 MiB
+# Every read buffers the whole file before it's truncated, so this bounds the peak
+# memory used by a message's attachments to this many times MAX_ZIG_FILE_SIZE.
+MAX_CONCURRENT_ATTACHMENT_READS = 2
 FILE_HIGHLIGHT_NOTE = '\nOn desktop, click "View whole file" to see the highlighting.'
 OMISSION_NOTE = "\n-# {} codeblock{} omitted"
-
-# This pattern is intentionally simple; it's only meant to operate on sequences produced
-# by zig-codeblocks which will never appear in any other form.
-SGR_PATTERN = re.compile(r"\x1b\[[0-9;]+m")
+FILE_HIGHLIGHT_NOTE_LENGTH = len(FILE_HIGHLIGHT_NOTE)
+# A conservative estimate of the final omission note's length.
+OMISSION_NOTE_LENGTH = len(OMISSION_NOTE) + 5
 THEME = DEFAULT_THEME.copy()
 del THEME["Comment"]
+# Filenames only need to tell a message's attachments apart, so a counter will do.
+_file_numbers = count()
 
 
 def _apply_discord_wa(source: str) -> str:
@@ -55,13 +58,31 @@ def _apply_discord_wa(source: str) -> str:
     return source.replace("///", "\x1b[0m///").replace("// ", "\x1b[0m// ")
 
 
+# Edits are handled by processing both the old and the new message, so without this
+# every edit would highlight all of the old message's code again.
+@lru_cache(maxsize=64)
+def _highlight(source: str | bytes) -> str:
+    return highlight_zig_code(source, THEME)
+
+
 def _apply_discord_wa_in_ansi_codeblocks(source: str) -> str:
     # Resolves #274
-    for block in set(extract_codeblocks(source)):
-        if block.lang == "ansi":
-            body = str(block)
-            source = source.replace(body, _apply_discord_wa(body))
-    return source
+    if "```ansi" not in source:
+        # There is nothing to work around, so skip parsing the source.
+        return source
+    # The source is stitched together in a single pass rather than running replace()
+    # over all of it once per codeblock.
+    parts: list[str] = []
+    cursor = 0
+    for block in extract_codeblocks(source):
+        rendered = str(block)
+        if (start := source.find(rendered, cursor)) == -1:
+            continue
+        parts.append(source[cursor:start])
+        parts.append(_apply_discord_wa(rendered) if block.lang == "ansi" else rendered)
+        cursor = start + len(rendered)
+    parts.append(source[cursor:])
+    return "".join(parts)
 
 
 @final
@@ -94,10 +115,12 @@ class CodeblockActions(ItemActions):
         )
         assert isinstance(webhook_channel, dc.TextChannel | dc.ForumChannel)
 
-        webhook = await get_or_create_webhook(webhook_channel)
         self.message.content = self._replaced_message_content
-        await move_message(
-            self.bot, webhook, self.message, thread=thread, include_move_marks=False
+        await with_webhook(
+            webhook_channel,
+            lambda webhook: move_message(
+                self.bot, webhook, self.message, thread=thread, include_move_marks=False
+            ),
         )
 
 
@@ -110,34 +133,48 @@ class ZigCodeblocks(commands.Cog):
 
     @staticmethod
     async def _collect_attachments(message: dc.Message) -> list[dc.File]:
+        zig_attachments = [
+            att
+            for att in message.attachments
+            if att.filename.endswith(".zig") and att.size <= MAX_ZIG_FILE_SIZE
+        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ATTACHMENT_READS)
+
+        async def read(att: dc.Attachment) -> bytes:
+            async with semaphore:
+                # Truncate right away so that only MAX_CONTENT bytes of each file stay
+                # in memory while the other downloads finish.
+                return (await att.read())[:MAX_CONTENT]
+
+        # Download a few of them at a time, then process them in order.
+        contents = await asyncio.gather(*map(read, zig_attachments))
         attachments: list[dc.File] = []
-        for att in message.attachments:
-            if not att.filename.endswith(".zig") or att.size > MAX_ZIG_FILE_SIZE:
-                continue
-            content = (await att.read())[:MAX_CONTENT]
-            if content.count(b"\n") <= 5 and len(content) <= 1900:
+        for att, content in zip(zig_attachments, contents, strict=True):
+            # Check the length first so that only short files get scanned for newlines.
+            if len(content) <= 1900 and content.count(b"\n") <= 5:
                 message.content = (
                     f"{CodeBlock('zig', content.decode())}\n{message.content}"
                 )
                 continue
+            highlighted = await asyncio.to_thread(_highlight, content)
             attachments.append(
-                dc.File(
-                    BytesIO(highlight_zig_code(content, THEME).encode()),
-                    att.filename + ".ansi",
-                )
+                dc.File(BytesIO(highlighted.encode()), att.filename + ".ansi")
             )
         return attachments
 
     @staticmethod
-    def _tallest_codeblock_to_file(codeblocks: list[CodeBlock]) -> dc.File:
-        tallest_codeblock = max(
-            codeblocks,
-            key=lambda cb: (len(cb.body.splitlines()), len(cb.body)),
-        )
-        codeblocks.remove(tallest_codeblock)
+    def _pop_tallest_codeblock(
+        codeblocks: list[CodeBlock], heights: list[tuple[int, int]]
+    ) -> CodeBlock:
+        index = max(range(len(codeblocks)), key=heights.__getitem__)
+        del heights[index]
+        return codeblocks.pop(index)
+
+    @staticmethod
+    def _codeblock_to_file(codeblock: CodeBlock) -> dc.File:
         return dc.File(
-            BytesIO(tallest_codeblock.body.encode()),
-            filename=f"{''.join(choices(string.ascii_letters, k=6))}.ansi",
+            BytesIO(codeblock.body.encode()),
+            filename=f"{next(_file_numbers):08x}.ansi",
         )
 
     @staticmethod
@@ -154,17 +191,25 @@ class ZigCodeblocks(commands.Cog):
             truncation_size = 2000 - len(user_note) - 1  # -1 for the ellipsis
             if attachments:
                 content = content.removesuffix(FILE_HIGHLIGHT_NOTE)
-                truncation_size -= len(FILE_HIGHLIGHT_NOTE)
+                truncation_size -= FILE_HIGHLIGHT_NOTE_LENGTH
                 user_note = f"{FILE_HIGHLIGHT_NOTE}{user_note}"
             content = f"{content[:truncation_size]}…{user_note}"
 
         return content
 
     async def process(self, message: dc.Message) -> ProcessedMessage:
+        # This runs for every message, and most have neither attachments nor
+        # codeblocks, in which case there's no need to hand the content to the parser.
+        if not message.attachments and "```zig" not in message.content:
+            return ProcessedMessage(item_count=0)
+
         attachments = await self._collect_attachments(message)
-        zig_codeblocks = [
-            c for c in extract_codeblocks(message.content) if c.lang == "zig"
-        ]
+        # Small attachments may have been inlined as codeblocks, hence the recheck.
+        zig_codeblocks = (
+            [c for c in extract_codeblocks(message.content) if c.lang == "zig"]
+            if "```zig" in message.content
+            else []
+        )
 
         if not zig_codeblocks:
             if not attachments:
@@ -175,28 +220,38 @@ class ZigCodeblocks(commands.Cog):
                 item_count=len(attachments),
             )
 
+        # Highlighting is CPU-bound and codeblocks can be fairly large, so it's done in
+        # worker threads to keep the event loop responsive.
+        highlighted_bodies = await asyncio.gather(
+            *(asyncio.to_thread(_highlight, c.body) for c in zig_codeblocks)
+        )
         highlighted_codeblocks = [
-            CodeBlock("ansi", _apply_discord_wa(highlight_zig_code(c.body, THEME)))
-            for c in zig_codeblocks
+            CodeBlock("ansi", _apply_discord_wa(body)) for body in highlighted_bodies
         ]
-        max_length = 2000 - (len(FILE_HIGHLIGHT_NOTE) if attachments else 0)
+        max_length = 2000 - (FILE_HIGHLIGHT_NOTE_LENGTH if attachments else 0)
         omitted_codeblocks = 0
-        while len(code := "".join(map(str, highlighted_codeblocks))) > max_length:
-            file = self._tallest_codeblock_to_file(highlighted_codeblocks)
+        # Keep a running total instead of joining all codeblocks on every iteration.
+        code_length = sum(len(str(c)) for c in highlighted_codeblocks)
+        # Each codeblock's (line count, length), computed once and kept in sync with
+        # highlighted_codeblocks, for finding the tallest codeblock.
+        heights = [(c.body.count("\n"), len(c.body)) for c in highlighted_codeblocks]
+        while code_length > max_length:
+            codeblock = self._pop_tallest_codeblock(highlighted_codeblocks, heights)
+            code_length -= len(str(codeblock))
 
             if len(attachments) < 10:
                 if not attachments:
                     # We now have an attachment so the note is gonna be displayed
-                    max_length -= len(FILE_HIGHLIGHT_NOTE)
-                attachments.append(file)
+                    max_length -= FILE_HIGHLIGHT_NOTE_LENGTH
+                attachments.append(self._codeblock_to_file(codeblock))
                 continue
 
             if not omitted_codeblocks:
-                # Expected final omission note size (conservative)
-                max_length -= len(OMISSION_NOTE) + 5
+                max_length -= OMISSION_NOTE_LENGTH
 
             omitted_codeblocks += 1
 
+        code = "".join(map(str, highlighted_codeblocks))
         return ProcessedMessage(
             content=self._add_user_notes(code, omitted_codeblocks, attachments),
             files=attachments,
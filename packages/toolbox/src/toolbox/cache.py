@@ -1,3 +1,4 @@
+import asyncio
 import datetime as dt
 from abc import ABC, abstractmethod
 
@@ -13,6 +14,7 @@ class TTLCache[KT, VT](ABC):
         """Keyword arguments are passed to datetime.timedelta."""
         self._ttl = dt.timedelta(**ttl)
         self._cache: dict[KT, tuple[dt.datetime, VT]] = {}
+        self._pending: dict[KT, asyncio.Task[None]] = {}
 
     def __contains__(self, key: KT) -> bool:
         return key in self._cache
@@ -27,6 +29,16 @@ class TTLCache[KT, VT](ABC):
     async def fetch(self, key: KT) -> None:
         pass
 
+    async def _fetch_coalesced(self, key: KT) -> None:
+        # Concurrent lookups of the same key share a single in-flight fetch instead of
+        # each making their own request.
+        if (pending := self._pending.get(key)) is None:
+            pending = asyncio.create_task(self.fetch(key))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shielded so that one cancelled caller doesn't cancel the fetch for the others.
+        await asyncio.shield(pending)
+
     def _prune_expired_keys(self) -> None:
         cache_name = type(self).__name__
         now = dt.datetime.now(tz=dt.UTC)
@@ -44,7 +56,7 @@ class TTLCache[KT, VT](ABC):
         self._prune_expired_keys()
         if key not in self:
             logger.debug("{key} not in cache; fetching", key=key)
-            await self.fetch(key)
+            await self._fetch_coalesced(key)
         try:
             _, value = self[key]
         except KeyError:
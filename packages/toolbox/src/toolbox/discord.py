@@ -117,15 +117,13 @@ def format_or_file(
     template: str | None = None,
     transform: Callable[[str], str] | None = None,
 ) -> tuple[str, dc.File | None]:
-    if template is None:
-        template = "{}"
-
-    full_message = template.format(message)
+    # Formatting with the default "{}" template would just copy the message.
+    full_message = message if template is None else template.format(message)
     if transform is not None:
         full_message = transform(full_message)
 
     if len(full_message) > 2000:
-        return template.format(""), dc.File(
+        return "" if template is None else template.format(""), dc.File(
             BytesIO(message.encode()), filename="content.md"
         )
     return full_message, None
@@ -20,6 +20,9 @@ __all__ = (
     "remove_view_after_delay",
 )
 
+# The maximum number of links kept at once; the oldest links are evicted past this.
+MAX_LINKS = 4096
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ProcessedMessage:
@@ -41,6 +44,9 @@ async def remove_view_after_delay(message: dc.Message, delay: float = 30.0) -> N
 class MessageLinker:
     def __init__(self) -> None:
         self._refs: dict[dc.Message, dc.Message] = {}
+        # Maps reply IDs back to their original messages so that finding the original
+        # of a reply (done on every bot message deletion) doesn't scan every link.
+        self._originals: dict[int, dc.Message] = {}
         self._frozen = set[dc.Message]()
 
     @property
@@ -79,16 +85,24 @@ class MessageLinker:
         if original in self._refs:
             msg = f"message {original.id} already has a reply linked"
             raise ValueError(msg)
+        # Expired links are freed above, but a busy day could still pile up enough
+        # links (each keeping two messages alive) to bloat memory, so evict the oldest
+        # ones; dicts keep insertion order, so those come first.
+        while len(self._refs) >= MAX_LINKS:
+            oldest = next(iter(self._refs))
+            logger.trace("too many links; evicting {msg}", msg=oldest)
+            self.unlink(oldest)
+            self.unfreeze(oldest)
         self._refs[original] = reply
+        self._originals[reply.id] = original
 
     def unlink(self, original: dc.Message) -> None:
         logger.debug("unlinking {msg}", msg=original)
-        self._refs.pop(original, None)
+        if (reply := self._refs.pop(original, None)) is not None:
+            self._originals.pop(reply.id, None)
 
     def get_original_message(self, reply: dc.Message) -> dc.Message | None:
-        return next(
-            (msg for msg, reply_ in self._refs.items() if reply == reply_), None
-        )
+        return self._originals.get(reply.id)
 
     def unlink_from_reply(self, reply: dc.Message) -> None:
         if (original_message := self.get_original_message(reply)) is not None:
@@ -1,5 +1,11 @@
 from .conversion import convert_nitro_emojis
-from .integration import get_or_create_webhook, message_can_be_moved, move_message
+from .integration import (
+    forget_webhooks,
+    get_or_create_webhook,
+    message_can_be_moved,
+    move_message,
+    with_webhook,
+)
 from .moved_message import MovedMessage, MovedMessageLookupFailed
 from .subtext import MOVED_MESSAGE_MODIFICATION_CUTOFF, SplitSubtext, Subtext
 
@@ -10,7 +16,9 @@ __all__ = (
     "SplitSubtext",
     "Subtext",
     "convert_nitro_emojis",
+    "forget_webhooks",
     "get_or_create_webhook",
     "message_can_be_moved",
     "move_message",
+    "with_webhook",
 )
@@ -178,9 +178,11 @@ def format_missing_reply(message: dc.Message) -> dc.Embed:
     )
 
 
-def format_interaction(message: dc.Message) -> str:
+def format_interaction(message: dc.Message, content: str | None = None) -> str:
+    if content is None:
+        content = message.content
     if not message.interaction_metadata:
-        return message.content
+        return content
     # HACK: Message.interaction is deprecated, and discord.py disables any warning
     # filter resulting in a bunch of warnings spammed in the logs even if it is ignored.
     # There is no other way to get the name, and Message._interaction is not marked
@@ -191,7 +193,7 @@ def format_interaction(message: dc.Message) -> str:
     else:
         name = "a command"
     user = message.interaction_metadata.user
-    return f"-# *{user.mention} used {name}*\n{message.content}"
+    return f"-# *{user.mention} used {name}*\n{content}"
 
 
 async def get_reply_embed(message: dc.Message) -> dc.Embed | None:
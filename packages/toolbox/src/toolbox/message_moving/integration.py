@@ -1,7 +1,8 @@
 import asyncio
 import datetime as dt
+from collections import defaultdict
 from functools import partial
-from typing import Literal, overload
+from typing import TYPE_CHECKING, Literal, overload
 
 import discord as dc
 
@@ -21,6 +22,12 @@ from toolbox.messages import (
     MessageData,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# From https://discord.com/developers/docs/topics/opcodes-and-status-codes#json-json-error-codes.
+_UNKNOWN_WEBHOOK = 10015
+
 
 def message_can_be_moved(message: dc.Message) -> bool:
     return (
@@ -29,8 +36,52 @@ def message_can_be_moved(message: dc.Message) -> bool:
     )
 
 
+# Webhooks hardly ever change, so they're cached to save a request or two every time a
+# message is moved. Call forget_webhooks() when a channel's webhooks are updated.
+_webhook_cache: dict[tuple[int, str], dc.Webhook] = {}
+_webhook_locks = defaultdict[tuple[int, str], asyncio.Lock](asyncio.Lock)
+
+
 async def get_or_create_webhook(
     channel: dc.TextChannel | dc.ForumChannel, name: str = "Ghostty Moderator"
+) -> dc.Webhook:
+    key = channel.id, name
+    if (webhook := _webhook_cache.get(key)) is not None:
+        return webhook
+    async with _webhook_locks[key]:
+        # Another task might've fetched or created the webhook while this one waited.
+        if (webhook := _webhook_cache.get(key)) is None:
+            webhook = _webhook_cache[key] = await _fetch_or_create_webhook(
+                channel, name
+            )
+    return webhook
+
+
+def forget_webhooks(channel_id: int) -> None:
+    for key in [key for key in _webhook_cache if key[0] == channel_id]:
+        del _webhook_cache[key]
+
+
+async def with_webhook[T](
+    channel: dc.TextChannel | dc.ForumChannel,
+    action: Callable[[dc.Webhook], Awaitable[T]],
+    name: str = "Ghostty Moderator",
+) -> T:
+    webhook = await get_or_create_webhook(channel, name)
+    try:
+        return await action(webhook)
+    except dc.NotFound as e:
+        if e.code != _UNKNOWN_WEBHOOK:
+            raise
+    # The cached webhook was deleted without an on_webhooks_update reaching us (e.g.
+    # while the bot was offline), so drop it and try again once with a fresh one.
+    if _webhook_cache.get(key := (channel.id, name)) is webhook:
+        del _webhook_cache[key]
+    return await action(await get_or_create_webhook(channel, name))
+
+
+async def _fetch_or_create_webhook(
+    channel: dc.TextChannel | dc.ForumChannel, name: str
 ) -> dc.Webhook:
     webhooks = await channel.webhooks()
     for webhook in webhooks:
@@ -117,20 +168,22 @@ async def move_message(  # noqa: PLR0913
     else:
         poll = message.poll
 
+    message_content = message.content
     if include_move_marks and isinstance(
         moved_message := await MovedMessage.from_message(message), MovedMessage
     ):
-        # Append the new move mark to the existing subtext.
+        # Append the new move mark to the existing subtext. `message` itself is left
+        # untouched so that it can be moved again, e.g. by with_webhook() retrying.
         split_subtext = SplitSubtext(moved_message)
         split_subtext.update(message, executor)
-        message.content, subtext = split_subtext.content, split_subtext.subtext
+        message_content, subtext = split_subtext.content, split_subtext.subtext
     else:
         # The if expression skips the poll ended message if there was no poll.
         s = Subtext(msg_data, executor, poll if message.poll is not None else None)
         subtext = s.format() if include_move_marks else s.format_simple()
 
     content, file = format_or_file(
-        format_interaction(message),
+        format_interaction(message, message_content),
         template=f"{{}}\n{subtext}",
         transform=partial(convert_nitro_emojis, client, message.guild),
     )
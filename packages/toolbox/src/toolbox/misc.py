@@ -1,6 +1,7 @@
 import asyncio
 import re
 import subprocess
+from contextlib import aclosing
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
@@ -13,6 +14,7 @@ __all__ = (
     "URL_REGEX",
     "aenumerate",
     "async_process_check_output",
+    "atake",
     "format_diff_note",
     "truncate",
 )
@@ -49,6 +51,21 @@ async def aenumerate[T](
         i += 1
 
 
+async def atake[T](it: AsyncGenerator[T], n: int) -> list[T]:
+    # Stops pulling items as soon as n have been collected, so that lazy generators
+    # (e.g. ones that make an API request per item) don't do more work than necessary.
+    # The generator is closed right away instead of whenever it's garbage collected.
+    items: list[T] = []
+    async with aclosing(it):
+        if n <= 0:
+            return items
+        async for x in it:
+            items.append(x)
+            if len(items) == n:
+                break
+    return items
+
+
 def format_diff_note(additions: int, deletions: int, changed_files: int) -> str | None:
     if not (changed_files and (additions or deletions)):
         return None  # Diff size unavailable
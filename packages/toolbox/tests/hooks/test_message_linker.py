@@ -42,6 +42,15 @@ def test_linker_retrieve_original_message(linker: MessageLinker) -> None:
     assert not linker.refs
 
 
+def test_unlink_forgets_reply(linker: MessageLinker) -> None:
+    msg = spawn_user_message(id=1)
+    reply = spawn_user_message(id=2)
+    linker.link(msg, reply)
+
+    linker.unlink(msg)
+    assert linker.get_original_message(reply) is None
+
+
 def test_free_dangling_links(linker: MessageLinker) -> None:
     expected_to_stay: list[dc.Message] = []
     expected_to_go: list[dc.Message] = []
@@ -59,3 +68,16 @@ def test_free_dangling_links(linker: MessageLinker) -> None:
     for msg in expected_to_go:
         assert msg not in linker.refs
         assert not linker.is_frozen(msg)
+
+
+def test_link_evicts_oldest(
+    linker: MessageLinker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("toolbox.linker.MAX_LINKS", 3)
+    messages = [spawn_user_message(id=i) for i in range(4)]
+    for msg in messages:
+        linker.link(msg, msg)
+
+    assert messages[0] not in linker.refs
+    assert linker.get_original_message(messages[0]) is None
+    assert all(msg in linker.refs for msg in messages[1:])
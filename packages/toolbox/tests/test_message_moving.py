@@ -2,7 +2,7 @@
 # pyright: reportPrivateUsage=false
 import datetime as dt
 import re
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import discord as dc
 import pytest
@@ -13,7 +13,11 @@ from toolbox.message_moving import (
     MovedMessage,
     SplitSubtext,
     Subtext,
+    forget_webhooks,
+    get_or_create_webhook,
     message_can_be_moved,
+    move_message,
+    with_webhook,
 )
 from toolbox.message_moving.conversion import _unattachable_embed, convert_nitro_emojis
 from toolbox.message_moving.moved_message import _find_snowflake
@@ -646,3 +650,97 @@ def test_moved_message_init_errors(message_content: str, error_message: str) ->
     message = Mock(dc.WebhookMessage, content=message_content)
     with pytest.raises(ValueError, match=re.escape(error_message)):
         MovedMessage(message, author=Mock(dc.Member, id=123))
+
+
+async def test_get_or_create_webhook_is_cached() -> None:
+    webhook = Mock(dc.Webhook, token="token")
+    webhook.name = "Ghostty Moderator"
+    channel = Mock(dc.TextChannel, id=1, webhooks=AsyncMock(return_value=[webhook]))
+
+    assert await get_or_create_webhook(channel) is webhook
+    assert await get_or_create_webhook(channel) is webhook
+    channel.webhooks.assert_awaited_once()
+
+    forget_webhooks(channel.id)
+    assert await get_or_create_webhook(channel) is webhook
+    assert channel.webhooks.await_count == 2
+
+
+async def test_with_webhook_retries_deleted_webhook() -> None:
+    dead, fresh = Mock(dc.Webhook, token="token"), Mock(dc.Webhook, token="token")
+    dead.name = fresh.name = "Ghostty Moderator"
+    channel = Mock(
+        dc.TextChannel, id=2, webhooks=AsyncMock(side_effect=[[dead], [fresh]])
+    )
+    response = Mock(status=404, reason="Not Found")
+    action = AsyncMock(
+        side_effect=[
+            dc.NotFound(response, {"code": 10015, "message": "Unknown Webhook"}),
+            "sent",
+        ]
+    )
+
+    assert await with_webhook(channel, action) == "sent"
+    assert [call.args for call in action.await_args_list] == [(dead,), (fresh,)]
+    assert await get_or_create_webhook(channel) is fresh
+
+
+async def test_with_webhook_retry_keeps_move_history(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    subtext = "-# Authored by <@123>, moved from <#456> by <@789>"
+    message = Mock(
+        dc.WebhookMessage,
+        content=f"meow\n{subtext}",
+        guild=Mock(dc.Guild),
+        type=dc.MessageType.default,
+        attachments=[],
+        embeds=[],
+        stickers=[],
+        reactions=[],
+        message_snapshots=[],
+        poll=None,
+        interaction_metadata=None,
+    )
+
+    async def from_message(msg: dc.Message) -> MovedMessage:
+        return Mock(MovedMessage, content=msg.content)
+
+    monkeypatch.setattr(MovedMessage, "from_message", from_message)
+    monkeypatch.setattr(
+        "toolbox.message_moving.integration.get_reply_embed",
+        AsyncMock(return_value=None),
+    )
+
+    response = Mock(status=404, reason="Not Found")
+    dead = Mock(
+        dc.Webhook,
+        token="token",
+        send=AsyncMock(
+            side_effect=dc.NotFound(
+                response, {"code": 10015, "message": "Unknown Webhook"}
+            )
+        ),
+    )
+    fresh = Mock(
+        dc.Webhook,
+        token="token",
+        send=AsyncMock(
+            side_effect=lambda **kwargs: Mock(
+                dc.WebhookMessage, content=kwargs["content"]
+            )
+        ),
+    )
+    dead.name = fresh.name = "Ghostty Moderator"
+    channel = Mock(
+        dc.TextChannel, id=3, webhooks=AsyncMock(side_effect=[[dead], [fresh]])
+    )
+
+    moved = await with_webhook(
+        channel, lambda webhook: move_message(Mock(dc.Client), webhook, message)
+    )
+
+    assert message.content == f"meow\n{subtext}"
+    assert fresh.send.await_args is not None
+    assert fresh.send.await_args.kwargs["content"] == f"meow\n{subtext}"
+    assert moved.original_author_id == 123
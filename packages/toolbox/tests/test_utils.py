@@ -1,7 +1,8 @@
+import asyncio
 import datetime as dt
 import subprocess
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, final, override
 from unittest.mock import Mock
 
 import discord as dc
@@ -9,6 +10,7 @@ import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 
+from toolbox.cache import TTLCache
 from toolbox.discord import (
     Account,
     dynamic_timestamp,
@@ -23,6 +25,7 @@ from toolbox.messages import is_attachment_only
 from toolbox.misc import (
     aenumerate,
     async_process_check_output,
+    atake,
     format_diff_note,
     truncate,
 )
@@ -101,6 +104,28 @@ async def test_aenumerate[T](items: list[T], start: int) -> None:
     )
 
 
+@given(st.lists(st.integers()), st.integers(max_value=20))
+async def test_atake(items: list[int], n: int) -> None:
+    consumed = 0
+    closed = False
+
+    async def async_iterator() -> AsyncGenerator[int]:
+        nonlocal consumed, closed
+        try:
+            for item in items:
+                consumed += 1
+                yield item
+        finally:
+            closed = True
+
+    it = async_iterator()
+    assert await atake(it, n) == items[: max(n, 0)]
+    assert consumed == min(max(n, 0), len(items))
+    # A generator that was never started has nothing to clean up.
+    assert closed or consumed == 0
+    assert it.ag_frame is None
+
+
 @pytest.mark.parametrize(
     ("attachments", "content", "preprocessed_content", "embeds", "result"),
     [
@@ -290,3 +315,21 @@ def test_pretty_print_account(name: str, id_: int) -> None:
     output = pretty_print_account(fake_account)
     assert name in output
     assert str(id_) in output
+
+
+@final
+class CountingCache(TTLCache[int, int]):
+    fetches = 0
+
+    @override
+    async def fetch(self, key: int) -> None:
+        self.fetches += 1
+        await asyncio.sleep(0)
+        self[key] = key * 2
+
+
+async def test_ttl_cache_coalesces_concurrent_fetches() -> None:
+    cache = CountingCache(minutes=1)
+    results = await asyncio.gather(*(cache.get(21) for _ in range(5)))
+    assert results == [42] * 5
+    assert cache.fetches == 1